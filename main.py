@@ -8,12 +8,16 @@ import argparse
 import logging
 import json  # Added for JSON support
 import time
+import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(filename='doc_logger.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 LOG_PATH = 'doc_log.xlsx'
+SUMMARY_CACHE_PATH = 'summary_cache.json'
+SUMMARY_FORMATS = ('txt', 'csv', 'json')
 
 
 def format_date(date):
@@ -295,51 +299,279 @@ def main():
         log_to_excel(parsed_data, file_name)
 
 
-# Function to generate a summary report
-def generate_summary_report(output_format='txt'):
-    try:
-        # Read the existing Excel log
-        df = pd.read_excel('doc_log.xlsx')
+# Function to summarize a single log partition (runs in a worker process)
+def _summarize_partition(log_path):
+    """
+    Aggregates the document sheets of one Excel log partition.
 
-        # Group by document name and file type to get some stats
-        doc_summary = df.groupby('Document Name').agg({
-            'Content': 'count',
-            'Timestamp': 'max'
-        }).reset_index()
+    Every sheet carrying 'Document Name' and 'Content' columns is included,
+    so sheet rollovers are counted while the 'Errors' sheet is skipped.
 
-        num_docs = len(doc_summary)
-        total_lines = df['Content'].count()
+    Parameters:
+    log_path (str): Path of the Excel log partition to read.
 
-        # Create summary report
-        summary = "Summary Report:\n\n"
-        summary += f"Total Documents Processed: {num_docs}\n"
-        summary += f"Total Lines Logged: {total_lines}\n\n"
-        summary += "Document Details:\n"
+    Returns:
+    dict: Document name mapped to its line count and last update time.
+    """
+    sheets = pd.read_excel(log_path, sheet_name=None)
+    frames = [df for df in sheets.values()
+              if {'Document Name', 'Content'}.issubset(df.columns)]
+    documents = {}
+    if not frames:
+        return documents
+
+    df = pd.concat(frames, ignore_index=True)
+    if 'Timestamp' not in df.columns:
+        df['Timestamp'] = pd.NaT
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
+    doc_summary = df.groupby('Document Name').agg({
+        'Content': 'count',
+        'Timestamp': 'max'
+    })
+
+    for name, row in doc_summary.iterrows():
+        last_updated = None
+        if not pd.isna(row['Timestamp']):
+            last_updated = format_date(row['Timestamp'])
+        documents[str(name)] = {'lines': int(row['Content']),
+                                'last_updated': last_updated}
+    return documents
+
+
+def resolve_log_partitions(log_paths=LOG_PATH):
+    """
+    Expands log paths and glob patterns into a sorted list of partitions.
 
-        for index, row in doc_summary.iterrows():
-            summary += f"Document: {row['Document Name']}, \
-            Lines: {row['Content']}, Last Updated: {row['Timestamp']}\n"
+    Parameters:
+    log_paths (str or list): A path, glob pattern or list of either,
+                             e.g. 'backup_*_doc_log.xlsx'.
 
-        # Save the summary to a text file
-        with open('summary_report.txt', 'w') as file:
-            file.write(summary)
+    Returns:
+    list: Sorted, de-duplicated paths of existing log files.
+    """
+    if isinstance(log_paths, str):
+        log_paths = [log_paths]
+
+    partitions = set()
+    for pattern in log_paths:
+        matches = [path for path in glob.glob(pattern)
+                   if os.path.isfile(path)]
+        if not matches:
+            logging.warning(f"No log partitions match: {pattern}")
+        partitions.update(os.path.abspath(path) for path in matches)
+    return sorted(partitions)
+
+
+def _load_summary_cache(cache_path):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            cache = json.load(cache_file)
+    except Exception as e:
+        logging.error(f"Error reading summary cache {cache_path}: {e}")
+        return {}
+    if not isinstance(cache, dict):
+        logging.warning(f"Ignoring malformed summary cache {cache_path}")
+        return {}
+    return cache
 
-        print("Summary report generated and saved as 'summary_report.txt'")
 
+def _save_summary_cache(cache, cache_path):
+    if not cache_path:
+        return
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(cache, cache_file, indent=4)
     except Exception as e:
-        print(f"Error generating summary report: {e}")
+        logging.error(f"Error writing summary cache {cache_path}: {e}")
+
+
+def _partition_signature(log_path):
+    stat = os.stat(log_path)
+    return {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _cached_partition(cache, log_path, signature):
+    """
+    Returns the cached aggregates for a partition, or None on a miss.
+    Malformed or old-schema entries count as a miss.
+    """
+    cached = cache.get(log_path)
+    if not isinstance(cached, dict) or \
+            not isinstance(cached.get('documents'), dict):
+        return None
+    if any(cached.get(key) != value for key, value in signature.items()):
+        return None
+    return cached['documents']
+
+
+def _merge_partition_summaries(partials):
+    """
+    Merges per-partition aggregates: line counts are summed and the
+    latest update time across partitions is kept.
+    """
+    merged = {}
+    for documents in partials:
+        for name, stats in documents.items():
+            entry = merged.setdefault(name, {'lines': 0,
+                                             'last_updated': None})
+            entry['lines'] += stats['lines']
+            # format_date output sorts chronologically as a string
+            if stats['last_updated'] and (
+                    entry['last_updated'] is None
+                    or stats['last_updated'] > entry['last_updated']):
+                entry['last_updated'] = stats['last_updated']
+    return dict(sorted(merged.items()))
+
 
+# Function to generate a summary report
+def generate_summary_report(output_format='txt', log_paths=LOG_PATH,
+                            cache_path=SUMMARY_CACHE_PATH, max_workers=None,
+                            output_dir='.'):
+    """
+    Generates a summary report across one or more Excel log partitions.
+
+    Partitions whose modification time and size match the cache are not
+    re-read; the rest are aggregated concurrently in a process pool.
+
+    Parameters:
+    output_format (str): One of 'txt', 'csv' or 'json'. Default is 'txt'.
+    log_paths (str or list): Log paths or glob patterns to summarize.
+                             Default is 'doc_log.xlsx'.
+    cache_path (str): JSON file holding per-partition aggregates.
+                      Pass None to disable caching.
+    max_workers (int): Maximum number of worker processes.
+    output_dir (str): Directory the report is written to.
+
+    Returns:
+    dict: The merged summary, or None if it could not be generated.
+    """
+    if output_format not in SUMMARY_FORMATS:
+        logging.error(f"Unsupported summary format: {output_format}")
+        print(f"Unsupported summary format: {output_format}")
+        return None
+    if max_workers is not None and max_workers < 1:
+        logging.error(f"Invalid number of workers: {max_workers}")
+        print(f"Invalid number of workers: {max_workers}")
+        return None
+
+    partitions = resolve_log_partitions(log_paths)
+    if not partitions:
+        print("Error generating summary report: no log files found.")
+        return None
+
+    cache = _load_summary_cache(cache_path)
+    partials = {}
+    stale = {}
+    failed = []
+    for log_path in partitions:
+        signature = _partition_signature(log_path)
+        documents = _cached_partition(cache, log_path, signature)
+        if documents is not None:
+            partials[log_path] = documents
+        else:
+            stale[log_path] = signature
+    logging.info(f"Summary over {len(partitions)} partitions, "
+                 f"{len(stale)} to read")
+
+    def record(log_path, documents):
+        partials[log_path] = documents
+        cache[log_path] = dict(stale[log_path], documents=documents)
+
+    if len(stale) == 1:
+        # Not worth spinning up a process pool for a single partition
+        log_path = next(iter(stale))
+        try:
+            record(log_path, _summarize_partition(log_path))
+        except Exception as e:
+            logging.error(f"Error summarizing {log_path}: {e}")
+            failed.append(log_path)
+    elif stale:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_summarize_partition, log_path):
+                       log_path for log_path in stale}
+            for future in as_completed(futures):
+                log_path = futures[future]
+                try:
+                    record(log_path, future.result())
+                except Exception as e:
+                    logging.error(f"Error summarizing {log_path}: {e}")
+                    failed.append(log_path)
+
+    # Drop aggregates of partitions that were deleted or rotated away
+    removed = [log_path for log_path in cache
+               if not os.path.isfile(log_path)]
+    for log_path in removed:
+        del cache[log_path]
+    if stale or removed:
+        _save_summary_cache(cache, cache_path)
+
+    failed.sort()
+    if failed:
+        print(f"Warning: could not read {len(failed)} log partition(s): "
+              f"{', '.join(failed)}")
+    if not partials:
+        print("Error generating summary report: "
+              "no log partition could be read.")
+        return None
+
+    documents = _merge_partition_summaries(
+        partials[log_path] for log_path in partitions
+        if log_path in partials)
+    summary = {
+        'Partitions': [log_path for log_path in partitions
+                       if log_path in partials],
+        'Total Documents Processed': len(documents),
+        'Total Lines Logged': sum(stats['lines']
+                                  for stats in documents.values()),
+        'Failed Partitions': failed,
+        'Documents': documents
+    }
+
+    # Save the summary based on the specified format
+    report_path = os.path.join(output_dir, f"summary_report.{output_format}")
+    try:
+        if output_format == 'csv':
+            pd.DataFrame([{'Document Name': name,
+                           'Content': stats['lines'],
+                           'Timestamp': stats['last_updated']}
+                          for name, stats in documents.items()],
+                         columns=['Document Name', 'Content', 'Timestamp']
+                         ).to_csv(report_path, index=False)
+        elif output_format == 'json':
+            with open(report_path, 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=4)
+        else:
+            report = "Summary Report:\n\n"
+            report += f"Partitions Read: {len(summary['Partitions'])}\n"
+            if failed:
+                report += f"Failed Partitions: {', '.join(failed)}\n"
+            report += ("Total Documents Processed: "
+                       f"{summary['Total Documents Processed']}\n")
+            report += ("Total Lines Logged: "
+                       f"{summary['Total Lines Logged']}\n\n")
+            report += "Document Details:\n"
+            for name, stats in documents.items():
+                report += (f"Document: {name}, Lines: {stats['lines']}, "
+                           f"Last Updated: {stats['last_updated']}\n")
+            with open(report_path, 'w', encoding='utf-8') as file:
+                file.write(report)
     except Exception as e:
+        logging.error(f"Error writing summary report: {e}")
         print(f"Error generating summary report: {e}")
+        return None
+
+    logging.info(f"Summary report saved as {report_path}")
+    print(f"Summary report generated and saved as '{report_path}'")
+    return summary
 
-    # Save the summary based on the specified format
-    if output_format == 'csv':
-        doc_summary.to_csv('summary_report.csv', index=False)
-        print("Summary report generated and saved as 'summary_report.csv'")
-    else:
-        with open('summary_report.txt', 'w') as file:
-            file.write(summary)
-        print("Summary report generated and saved as 'summary_report.txt'")
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
 
 
 def parse_args():
@@ -348,13 +580,19 @@ def parse_args():
                         help="Path to the document to be logged")
     parser.add_argument("--generate-summary", action="store_true",
                         help="Generate summary report after logging")
+    parser.add_argument("--summary-logs", nargs='+', default=[LOG_PATH],
+                        help="Log files or glob patterns to summarize, "
+                             "e.g. 'backup_*_doc_log.xlsx'")
+    parser.add_argument("--summary-format", choices=SUMMARY_FORMATS,
+                        default='txt', help="Summary report output format")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="Worker processes used to read log partitions")
     return parser.parse_args()
 
 
-args = parse_args()
-
-
 if __name__ == "__main__":
+    args = parse_args()
     log_document(args.file_path)
     if args.generate_summary:
-        generate_summary_report()
+        generate_summary_report(args.summary_format, args.summary_logs,
+                                max_workers=args.workers)
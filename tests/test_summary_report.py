@@ -0,0 +1,189 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from main import generate_summary_report, resolve_log_partitions, \
+                _summarize_partition
+import json
+import os
+import shutil
+import tempfile
+
+
+class TestPartitionedSummary(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tmp_dir, 'summary_cache.json')
+
+        # One partition with a sheet rollover and an 'Errors' sheet
+        daily = os.path.join(self.tmp_dir, 'doc_log_20240101.xlsx')
+        with pd.ExcelWriter(daily, engine='openpyxl') as writer:
+            pd.DataFrame({'Section': ['Section 1', 'Section 2'],
+                          'Content': ['Line 1', 'Line 2'],
+                          'Document Name': ['a.txt', 'a.txt'],
+                          'Timestamp': pd.to_datetime(
+                              ['2024-01-01 10:00:00', '2024-01-01 11:00:00'])
+                          }).to_excel(writer, sheet_name='Documents',
+                                      index=False)
+            pd.DataFrame({'Section': ['Section 1'],
+                          'Content': ['Line 1'],
+                          'Document Name': ['b.txt'],
+                          'Timestamp': pd.to_datetime(
+                              ['2024-01-01 12:00:00'])
+                          }).to_excel(writer, sheet_name='Documents_2',
+                                      index=False)
+            pd.DataFrame({'Error Message': ['boom'],
+                          'Document Name': ['c.txt'],
+                          'Timestamp': pd.to_datetime(
+                              ['2024-01-01 13:00:00'])
+                          }).to_excel(writer, sheet_name='Errors',
+                                      index=False)
+
+        self.daily = daily
+        backup = os.path.join(self.tmp_dir, 'doc_log_20240102.xlsx')
+        pd.DataFrame({'Section': ['Section 1'],
+                      'Content': ['Line 3'],
+                      'Document Name': ['a.txt'],
+                      'Timestamp': pd.to_datetime(['2024-01-02 09:00:00'])
+                      }).to_excel(backup, sheet_name='Documents',
+                                  index=False)
+
+        self.backup = backup
+        self.pattern = os.path.join(self.tmp_dir, 'doc_log_*.xlsx')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def summarize(self, output_format='txt'):
+        return generate_summary_report(output_format, self.pattern,
+                                       cache_path=self.cache_path,
+                                       max_workers=2,
+                                       output_dir=self.tmp_dir)
+
+    def test_resolve_log_partitions(self):
+        partitions = resolve_log_partitions([self.pattern, self.pattern])
+        self.assertEqual(len(partitions), 2)
+
+    def test_resolve_log_partitions_mixed(self):
+        missing = os.path.join(self.tmp_dir, 'missing_*.xlsx')
+        partitions = resolve_log_partitions([self.daily, self.pattern,
+                                             missing])
+        self.assertEqual(partitions, sorted([os.path.abspath(self.daily),
+                                             os.path.abspath(self.backup)]))
+        self.assertEqual(resolve_log_partitions(missing), [])
+
+    def test_merges_partitions(self):
+        summary = self.summarize()
+        self.assertEqual(summary['Total Documents Processed'], 2)
+        self.assertEqual(summary['Total Lines Logged'], 4)
+        self.assertEqual(summary['Documents']['a.txt'],
+                         {'lines': 3, 'last_updated': '2024-01-02 09:00:00'})
+        self.assertTrue(os.path.exists(
+            os.path.join(self.tmp_dir, 'summary_report.txt')))
+
+    def test_csv_and_json_output(self):
+        self.summarize('csv')
+        report = pd.read_csv(os.path.join(self.tmp_dir,
+                                          'summary_report.csv'))
+        self.assertEqual(list(report['Document Name']), ['a.txt', 'b.txt'])
+
+        self.summarize('json')
+        with open(os.path.join(self.tmp_dir, 'summary_report.json')) as f:
+            report = json.load(f)
+        self.assertEqual(report['Total Lines Logged'], 4)
+
+    def test_unchanged_partitions_are_not_reread(self):
+        first = self.summarize()
+        with patch('main._summarize_partition') as mock_summarize:
+            second = self.summarize()
+        mock_summarize.assert_not_called()
+        self.assertEqual(first['Documents'], second['Documents'])
+
+    def test_only_changed_partition_is_reread(self):
+        self.summarize()
+        pd.DataFrame({'Section': ['Section 1', 'Section 2'],
+                      'Content': ['Line 3', 'Line 4'],
+                      'Document Name': ['a.txt', 'd.txt'],
+                      'Timestamp': pd.to_datetime(['2024-01-02 09:00:00',
+                                                   '2024-01-02 10:00:00'])
+                      }).to_excel(self.backup, sheet_name='Documents',
+                                  index=False)
+
+        with patch('main._summarize_partition',
+                   wraps=_summarize_partition) as mock_summarize:
+            summary = self.summarize()
+        mock_summarize.assert_called_once_with(os.path.abspath(self.backup))
+        self.assertEqual(summary['Total Documents Processed'], 3)
+        self.assertEqual(summary['Total Lines Logged'], 5)
+
+    def test_single_partition_is_read_inline(self):
+        with patch('main.ProcessPoolExecutor') as mock_executor:
+            summary = generate_summary_report('txt', self.backup,
+                                              cache_path=self.cache_path,
+                                              output_dir=self.tmp_dir)
+        mock_executor.assert_not_called()
+        self.assertEqual(summary['Total Lines Logged'], 1)
+
+    def test_corrupt_partition_is_reported(self):
+        corrupt = os.path.join(self.tmp_dir, 'doc_log_corrupt.xlsx')
+        with open(corrupt, 'w') as f:
+            f.write("not a workbook")
+
+        summary = self.summarize('json')
+        self.assertEqual(summary['Failed Partitions'],
+                         [os.path.abspath(corrupt)])
+        self.assertEqual(summary['Total Lines Logged'], 4)
+        with open(os.path.join(self.tmp_dir, 'summary_report.json')) as f:
+            self.assertEqual(json.load(f)['Failed Partitions'],
+                             [os.path.abspath(corrupt)])
+
+    def test_all_partitions_failing_keeps_previous_report(self):
+        self.summarize()
+        report_path = os.path.join(self.tmp_dir, 'summary_report.txt')
+        with open(report_path) as f:
+            previous = f.read()
+
+        corrupt = os.path.join(self.tmp_dir, 'corrupt.xlsx')
+        open(corrupt, 'w').close()
+        self.assertIsNone(generate_summary_report(
+            'txt', corrupt, cache_path=self.cache_path,
+            output_dir=self.tmp_dir))
+        with open(report_path) as f:
+            self.assertEqual(f.read(), previous)
+
+    def test_deleted_partitions_are_evicted_from_cache(self):
+        self.summarize()
+        # Summarizing a subset must keep the other cached partitions
+        generate_summary_report('txt', self.daily,
+                                cache_path=self.cache_path,
+                                output_dir=self.tmp_dir)
+        with open(self.cache_path) as f:
+            self.assertIn(os.path.abspath(self.backup), json.load(f))
+
+        os.remove(self.backup)
+        self.summarize()
+        with open(self.cache_path) as f:
+            cache = json.load(f)
+        self.assertNotIn(os.path.abspath(self.backup), cache)
+        self.assertIn(os.path.abspath(self.daily), cache)
+
+    def test_malformed_cache_is_a_miss(self):
+        with open(self.cache_path, 'w') as f:
+            json.dump({os.path.abspath(self.daily): {'mtime': 0}}, f)
+        self.assertEqual(self.summarize()['Total Lines Logged'], 4)
+
+        with open(self.cache_path, 'w') as f:
+            json.dump(["not", "a", "dict"], f)
+        self.assertEqual(self.summarize()['Total Lines Logged'], 4)
+
+    def test_unsupported_format(self):
+        self.assertIsNone(self.summarize('xml'))
+
+    def test_invalid_workers(self):
+        for workers in (0, -1):
+            self.assertIsNone(generate_summary_report(
+                'txt', self.pattern, cache_path=self.cache_path,
+                max_workers=workers, output_dir=self.tmp_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()